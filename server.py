@@ -11,6 +11,7 @@ import time
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -19,6 +20,13 @@ from mcp.types import Tool, TextContent
 # Load environment variables from .env file
 load_dotenv()
 
+# Per-item response blocks, rendered with str.format_map in the tool handlers
+SEARCH_JOB_TEMPLATE = "  - **{name}** (ID: {id})\n{description}    Environment: {environment_id}\n    State: {state}\n\n"
+SEARCH_RUN_TEMPLATE = "  - Run ID: {id}\n    Job: {job_name}\n    Status: {status_humanized}\n    Started: {created_at}\n\n"
+RUN_TEMPLATE = "**Run ID: {id}**\n  Job: {job_name}\n  Status: {status_humanized}\n  Started: {created_at}\n  Finished: {finished_at}\n{trigger}\n"
+PROJECT_TEMPLATE = "**{name}**\n  ID: {id}\n  State: {state}\n{repository}\n"
+JOB_TEMPLATE = "**{name}**\n  ID: {id}\n  Project ID: {project_id}\n  Environment ID: {environment_id}\n  State: {state}\n{description}\n"
+
 
 class DbtCloudClient:
     """dbt Cloud API client with safety features"""
@@ -37,30 +45,62 @@ class DbtCloudClient:
             "Authorization": f"Token {self.api_token}",
             "Content-Type": "application/json"
         }
+        
+        # Long-lived client so keep-alive and HTTP/2 reuse connections across tool calls
+        self._client = httpx.AsyncClient(
+            base_url=f"{self.base_url}/api/v2/accounts/{self.account_id}/",
+            headers=self.headers,
+            http2=True,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+        
+        # Cap concurrent outbound calls so bursts of tool calls don't hammer the API rate limit
+        self._sem = asyncio.Semaphore(int(os.getenv("DBT_MAX_CONCURRENCY", "10")))
+        
+        # In-process TTL cache for rarely-changing GET responses (projects, jobs)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
     
     async def _make_request(self, method: str, endpoint: str, api_version: str = "v2", **kwargs) -> Dict:
         """Make authenticated request to dbt Cloud API
         
         Uses API v2 for job and run operations (v3 is for administrative operations)
         """
-        url = f"{self.base_url}/api/{api_version}/accounts/{self.account_id}/{endpoint}"
+        # v2 endpoints are relative to the client's base_url; other versions need a full URL
+        if api_version != "v2":
+            endpoint = f"{self.base_url}/api/{api_version}/accounts/{self.account_id}/{endpoint}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                **kwargs
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"API request failed: {response.status_code} - {response.text}")
-            
-            return response.json()
+        async with self._sem:
+            response = await self._client.request(method, endpoint, **kwargs)
+        
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise Exception(f"API request failed: {e.response.status_code} - {e.response.text}") from e
+        
+        return orjson.loads(response.content)
+    
+    async def _cached_get(self, endpoint: str, ttl: float = 60, **kwargs) -> Dict:
+        """GET an endpoint, reusing a cached response younger than ttl seconds"""
+        key = endpoint
+        if kwargs.get("params"):
+            key += orjson.dumps(kwargs["params"], option=orjson.OPT_SORT_KEYS).decode()
+        
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        response = await self._make_request("GET", endpoint, **kwargs)
+        self._cache[key] = (time.monotonic(), response)
+        return response
     
     async def get_projects(self) -> List[Dict]:
         """Get all projects"""
-        response = await self._make_request("GET", "projects/")
+        response = await self._cached_get("projects/")
         return response.get("data", [])
     
     async def get_jobs(self, project_id: Optional[int] = None) -> List[Dict]:
@@ -69,7 +109,7 @@ class DbtCloudClient:
         if project_id:
             endpoint += f"?project_id={project_id}"
         
-        response = await self._make_request("GET", endpoint)
+        response = await self._cached_get(endpoint)
         return response.get("data", [])
     
     async def get_runs(self, job_id: Optional[int] = None, project_id: Optional[int] = None, limit: int = 10) -> List[Dict]:
@@ -90,15 +130,17 @@ class DbtCloudClient:
         }
         
         response = await self._make_request("POST", f"jobs/{job_id}/run/", json=payload)
+        # A new run may change job state, so drop cached listings
+        self._cache.clear()
         return response.get("data", {})
     
     async def search_in_project(self, query: str, project_id: int) -> Dict:
         """Search for artifacts in a project (simplified approach)"""
-        # Get jobs for the project
-        jobs = await self.get_jobs(project_id)
-        
-        # Get recent runs to find artifacts
-        runs = await self.get_runs(project_id=project_id, limit=5)
+        # Get jobs for the project and recent runs to find artifacts concurrently
+        jobs, runs = await asyncio.gather(
+            self.get_jobs(project_id),
+            self.get_runs(project_id=project_id, limit=5)
+        )
         
         results = {
             "query": query,
@@ -107,138 +149,155 @@ class DbtCloudClient:
             "recent_runs": []
         }
         
-        # Filter jobs by query
-        for job in jobs:
-            if (query.lower() in job.get("name", "").lower() or 
-                query.lower() in job.get("description", "").lower()):
-                results["jobs"].append(job)
+        # Filter jobs by query (lowercase the query once, not per job)
+        q = query.lower()
+        results["jobs"] = [
+            job for job in jobs
+            if q in (job.get("name") or "").lower()
+            or q in (job.get("description") or "").lower()
+        ]
         
         # Add recent runs info
         results["recent_runs"] = runs[:3]  # Show last 3 runs
         
         return results
+    
+    async def search_in_projects(self, query: str, project_ids: List[int]) -> List[Dict]:
+        """Search several projects concurrently"""
+        return list(await asyncio.gather(
+            *(self.search_in_project(query, project_id) for project_id in project_ids)
+        ))
 
 
-# Initialize the server and client
+# Initialize the server; the client is created in main() once the event loop is running
 server = Server("dbt-guard-mcp")
-dbt_client = DbtCloudClient()
+dbt_client: Optional[DbtCloudClient] = None
 
 
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available tools"""
-    return [
-        Tool(
-            name="search_in_project", 
-            description="Search for jobs and artifacts in a dbt project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query for job names or descriptions"
-                    },
-                    "project_id": {
-                        "type": "integer", 
-                        "description": "Project ID to search in",
-                        "default": None
-                    }
+# Tool definitions are fixed, so build them once rather than on every list_tools call
+TOOLS: List[Tool] = [
+    Tool(
+        name="search_in_project", 
+        description="Search for jobs and artifacts in a dbt project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query for job names or descriptions"
                 },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_recent_runs",
-            description="Get recent job runs for a project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "integer",
-                        "description": "Project ID",
-                        "default": None
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of runs to retrieve",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 50
-                    }
+                "project_id": {
+                    "type": "integer", 
+                    "description": "Project ID to search in",
+                    "default": None
+                },
+                "project_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Optional list of project IDs to search across (takes precedence over project_id)"
                 }
-            }
-        ),
-        Tool(
-            name="preview_model",
-            description="Preview model data (safe read-only operation)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "integer",
-                        "description": "Project ID"
-                    },
-                    "model_name": {
-                        "type": "string",
-                        "description": "Model name"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of rows to preview",
-                        "default": 100,
-                        "minimum": 1,
-                        "maximum": 1000
-                    }
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_recent_runs",
+        description="Get recent job runs for a project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "integer",
+                    "description": "Project ID",
+                    "default": None
                 },
-                "required": ["project_id", "model_name"]
+                "limit": {
+                    "type": "integer",
+                    "description": "Number of runs to retrieve",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50
+                }
             }
-        ),
-        Tool(
-            name="trigger_job_with_confirmation",
-            description="Trigger a dbt Cloud job (REQUIRES EXPLICIT CONFIRMATION - potentially dangerous)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "job_id": {
-                        "type": "integer",
-                        "description": "Job ID to trigger"
-                    },
-                    "cause": {
-                        "type": "string",
-                        "description": "Reason for triggering the job",
-                        "default": "Triggered via MCP"
-                    },
-                    "confirm_execution": {
-                        "type": "boolean",
-                        "description": "REQUIRED: Must be true to confirm you want to execute this potentially dangerous operation",
-                        "default": False
-                    }
+        }
+    ),
+    Tool(
+        name="preview_model",
+        description="Preview model data (safe read-only operation)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "integer",
+                    "description": "Project ID"
                 },
-                "required": ["job_id", "confirm_execution"]
-            }
-        ),
-        Tool(
-            name="list_projects",
-            description="List all available dbt projects",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="list_jobs",
-            description="List dbt jobs (optionally filtered by project)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "integer",
-                        "description": "Optional project ID to filter jobs"
-                    }
+                "model_name": {
+                    "type": "string",
+                    "description": "Model name"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Number of rows to preview",
+                    "default": 100,
+                    "minimum": 1,
+                    "maximum": 1000
+                }
+            },
+            "required": ["project_id", "model_name"]
+        }
+    ),
+    Tool(
+        name="trigger_job_with_confirmation",
+        description="Trigger a dbt Cloud job (REQUIRES EXPLICIT CONFIRMATION - potentially dangerous)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "job_id": {
+                    "type": "integer",
+                    "description": "Job ID to trigger"
+                },
+                "cause": {
+                    "type": "string",
+                    "description": "Reason for triggering the job",
+                    "default": "Triggered via MCP"
+                },
+                "confirm_execution": {
+                    "type": "boolean",
+                    "description": "REQUIRED: Must be true to confirm you want to execute this potentially dangerous operation",
+                    "default": False
+                }
+            },
+            "required": ["job_id", "confirm_execution"]
+        }
+    ),
+    Tool(
+        name="list_projects",
+        description="List all available dbt projects",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="list_jobs",
+        description="List dbt jobs (optionally filtered by project)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "integer",
+                    "description": "Optional project ID to filter jobs"
                 }
             }
-        )
-    ]
+        }
+    )
+]
+
+
+@server.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available tools"""
+    return TOOLS
 
 
 @server.call_tool()
@@ -266,40 +325,56 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
 
 
 async def search_in_project(arguments: Dict[str, Any]) -> List[TextContent]:
-    """Search for jobs and artifacts in a project"""
+    """Search for jobs and artifacts in one or more projects"""
     query = arguments["query"]
-    project_id = arguments.get("project_id")
+    project_ids = arguments.get("project_ids")
     
-    results = await dbt_client.search_in_project(query, project_id)
+    if project_ids:
+        results_list = await dbt_client.search_in_projects(query, project_ids)
+    else:
+        results_list = [await dbt_client.search_in_project(query, arguments.get("project_id"))]
+    
+    parts = []
+    for results in results_list:
+        _append_search_results(parts, results)
     
-    result_text = f"Search results for '{query}' in project {project_id}:\n\n"
+    return [TextContent(type="text", text="".join(parts))]
+
+
+def _append_search_results(parts: List[str], results: Dict) -> None:
+    """Append the formatted search results for a single project"""
+    query = results["query"]
+    project_id = results["project_id"]
+    
+    parts.append(f"Search results for '{query}' in project {project_id}:\n\n")
     
     # Show matching jobs
     jobs = results.get("jobs", [])
     if jobs:
-        result_text += f"**Matching Jobs ({len(jobs)}):**\n"
+        parts.append(f"**Matching Jobs ({len(jobs)}):**\n")
         for job in jobs:
-            result_text += f"  - **{job['name']}** (ID: {job['id']})\n"
-            if job.get('description'):
-                result_text += f"    Description: {job['description']}\n"
-            result_text += f"    Environment: {job.get('environment_id', 'N/A')}\n"
-            result_text += f"    State: {job.get('state', 'Unknown')}\n"
-            result_text += "\n"
+            description = job.get("description")
+            parts.append(SEARCH_JOB_TEMPLATE.format_map({
+                "name": job["name"],
+                "id": job["id"],
+                "description": f"    Description: {description}\n" if description else "",
+                "environment_id": job.get("environment_id", "N/A"),
+                "state": job.get("state", "Unknown")
+            }))
     else:
-        result_text += f"**No jobs found matching '{query}'**\n\n"
+        parts.append(f"**No jobs found matching '{query}'**\n\n")
     
     # Show recent runs
     runs = results.get("recent_runs", [])
     if runs:
-        result_text += f"**Recent Runs (last {len(runs)}):**\n"
+        parts.append(f"**Recent Runs (last {len(runs)}):**\n")
         for run in runs:
-            result_text += f"  - Run ID: {run['id']}\n"
-            result_text += f"    Job: {run.get('job', {}).get('name', 'Unknown')}\n"
-            result_text += f"    Status: {run.get('status_humanized', 'Unknown')}\n"
-            result_text += f"    Started: {run.get('created_at', 'N/A')}\n"
-            result_text += "\n"
-    
-    return [TextContent(type="text", text=result_text)]
+            parts.append(SEARCH_RUN_TEMPLATE.format_map({
+                "id": run["id"],
+                "job_name": (run.get("job") or {}).get("name", "Unknown"),
+                "status_humanized": run.get("status_humanized", "Unknown"),
+                "created_at": run.get("created_at", "N/A")
+            }))
 
 
 async def get_recent_runs(arguments: Dict[str, Any]) -> List[TextContent]:
@@ -312,19 +387,20 @@ async def get_recent_runs(arguments: Dict[str, Any]) -> List[TextContent]:
     if not runs:
         return [TextContent(type="text", text=f"No recent runs found for project {project_id}")]
     
-    result_text = f"Recent Runs for Project {project_id} (last {len(runs)}):\n\n"
+    parts = [f"Recent Runs for Project {project_id} (last {len(runs)}):\n\n"]
     
     for run in runs:
-        result_text += f"**Run ID: {run['id']}**\n"
-        result_text += f"  Job: {run.get('job', {}).get('name', 'Unknown')}\n"
-        result_text += f"  Status: {run.get('status_humanized', 'Unknown')}\n"
-        result_text += f"  Started: {run.get('created_at', 'N/A')}\n"
-        result_text += f"  Finished: {run.get('finished_at', 'N/A')}\n"
-        if run.get('trigger', {}).get('cause'):
-            result_text += f"  Trigger: {run['trigger']['cause']}\n"
-        result_text += "\n"
-    
-    return [TextContent(type="text", text=result_text)]
+        cause = (run.get("trigger") or {}).get("cause")
+        parts.append(RUN_TEMPLATE.format_map({
+            "id": run["id"],
+            "job_name": (run.get("job") or {}).get("name", "Unknown"),
+            "status_humanized": run.get("status_humanized", "Unknown"),
+            "created_at": run.get("created_at", "N/A"),
+            "finished_at": run.get("finished_at", "N/A"),
+            "trigger": f"  Trigger: {cause}\n" if cause else ""
+        }))
+    
+    return [TextContent(type="text", text="".join(parts))]
 
 
 async def preview_model(arguments: Dict[str, Any]) -> List[TextContent]:
@@ -335,17 +411,17 @@ async def preview_model(arguments: Dict[str, Any]) -> List[TextContent]:
     
     preview_data = await dbt_client.preview_model(project_id, model_name, limit)
     
-    result_text = f"🔍 Model Preview: {model_name}\n\n"
-    result_text += f"✅ This is a SAFE read-only operation\n\n"
-    result_text += f"**Model Information:**\n"
-    result_text += f"  Name: {preview_data['model']['name']}\n"
-    result_text += f"  ID: {preview_data['model']['id']}\n"
-    result_text += f"  Package: {preview_data['model'].get('package_name', 'N/A')}\n"
-    result_text += f"  Limit: {limit} rows\n\n"
-    result_text += f"**Note:** {preview_data['preview_note']}\n"
-    result_text += f"**Warning:** {preview_data['warning']}\n"
-    
-    return [TextContent(type="text", text=result_text)]
+    parts = [f"🔍 Model Preview: {model_name}\n\n"]
+    parts.append(f"✅ This is a SAFE read-only operation\n\n")
+    parts.append(f"**Model Information:**\n")
+    parts.append(f"  Name: {preview_data['model']['name']}\n")
+    parts.append(f"  ID: {preview_data['model']['id']}\n")
+    parts.append(f"  Package: {preview_data['model'].get('package_name', 'N/A')}\n")
+    parts.append(f"  Limit: {limit} rows\n\n")
+    parts.append(f"**Note:** {preview_data['preview_note']}\n")
+    parts.append(f"**Warning:** {preview_data['warning']}\n")
+    
+    return [TextContent(type="text", text="".join(parts))]
 
 
 async def trigger_job_with_confirmation(arguments: Dict[str, Any]) -> List[TextContent]:
@@ -355,39 +431,39 @@ async def trigger_job_with_confirmation(arguments: Dict[str, Any]) -> List[TextC
     confirm_execution = arguments.get("confirm_execution", False)
     
     if not confirm_execution:
-        result_text = f"🚨 **DANGEROUS OPERATION BLOCKED** 🚨\n\n"
-        result_text += f"You attempted to trigger job ID {job_id} without confirmation.\n\n"
-        result_text += f"**This operation would:**\n"
-        result_text += f"  - Trigger dbt Cloud job: {job_id}\n"
-        result_text += f"  - Cause: {cause}\n"
-        result_text += f"  - Potentially run dbt models and modify data in your data warehouse\n"
-        result_text += f"  - Consume compute resources and may incur costs\n\n"
-        result_text += f"**To proceed, you MUST:**\n"
-        result_text += f"  1. Understand the risks of this operation\n"
-        result_text += f"  2. Set 'confirm_execution' to true\n"
-        result_text += f"  3. Re-run this command\n\n"
-        result_text += f"⚠️  **WARNING: This will execute actual dbt operations that may modify your data!**\n"
+        parts = [f"🚨 **DANGEROUS OPERATION BLOCKED** 🚨\n\n"]
+        parts.append(f"You attempted to trigger job ID {job_id} without confirmation.\n\n")
+        parts.append(f"**This operation would:**\n")
+        parts.append(f"  - Trigger dbt Cloud job: {job_id}\n")
+        parts.append(f"  - Cause: {cause}\n")
+        parts.append(f"  - Potentially run dbt models and modify data in your data warehouse\n")
+        parts.append(f"  - Consume compute resources and may incur costs\n\n")
+        parts.append(f"**To proceed, you MUST:**\n")
+        parts.append(f"  1. Understand the risks of this operation\n")
+        parts.append(f"  2. Set 'confirm_execution' to true\n")
+        parts.append(f"  3. Re-run this command\n\n")
+        parts.append(f"⚠️  **WARNING: This will execute actual dbt operations that may modify your data!**\n")
         
-        return [TextContent(type="text", text=result_text)]
+        return [TextContent(type="text", text="".join(parts))]
     
     # If confirmed, proceed with the operation
     try:
         run_result = await dbt_client.trigger_job(job_id, cause)
         
-        result_text = f"✅ **JOB TRIGGERED SUCCESSFULLY** ✅\n\n"
-        result_text += f"**Job Details:**\n"
-        result_text += f"  - Job ID: {job_id}\n"
-        result_text += f"  - Run ID: {run_result.get('id', 'N/A')}\n"
-        result_text += f"  - Status: {run_result.get('status_humanized', 'Unknown')}\n"
-        result_text += f"  - Cause: {cause}\n\n"
-        result_text += f"**Monitor the run in dbt Cloud dashboard for progress and results.**\n"
+        parts = [f"✅ **JOB TRIGGERED SUCCESSFULLY** ✅\n\n"]
+        parts.append(f"**Job Details:**\n")
+        parts.append(f"  - Job ID: {job_id}\n")
+        parts.append(f"  - Run ID: {run_result.get('id', 'N/A')}\n")
+        parts.append(f"  - Status: {run_result.get('status_humanized', 'Unknown')}\n")
+        parts.append(f"  - Cause: {cause}\n\n")
+        parts.append(f"**Monitor the run in dbt Cloud dashboard for progress and results.**\n")
         
-        return [TextContent(type="text", text=result_text)]
+        return [TextContent(type="text", text="".join(parts))]
         
     except Exception as e:
-        result_text = f"❌ **JOB TRIGGER FAILED** ❌\n\n"
-        result_text += f"Failed to trigger job {job_id}: {str(e)}\n"
-        return [TextContent(type="text", text=result_text)]
+        parts = [f"❌ **JOB TRIGGER FAILED** ❌\n\n"]
+        parts.append(f"Failed to trigger job {job_id}: {str(e)}\n")
+        return [TextContent(type="text", text="".join(parts))]
 
 
 async def list_projects(arguments: Dict[str, Any]) -> List[TextContent]:
@@ -397,56 +473,56 @@ async def list_projects(arguments: Dict[str, Any]) -> List[TextContent]:
     if not projects:
         return [TextContent(type="text", text="No projects found")]
     
-    result_text = f"Available dbt Projects ({len(projects)}):\n\n"
+    parts = [f"Available dbt Projects ({len(projects)}):\n\n"]
     
     for project in projects:
-        result_text += f"**{project['name']}**\n"
-        result_text += f"  ID: {project['id']}\n"
-        result_text += f"  State: {project.get('state', 'Unknown')}\n"
-        if project.get('repository_name'):
-            result_text += f"  Repository: {project['repository_name']}\n"
-        result_text += "\n"
-    
-    return [TextContent(type="text", text=result_text)]
+        repository_name = project.get("repository_name")
+        parts.append(PROJECT_TEMPLATE.format_map({
+            "name": project["name"],
+            "id": project["id"],
+            "state": project.get("state", "Unknown"),
+            "repository": f"  Repository: {repository_name}\n" if repository_name else ""
+        }))
+    
+    return [TextContent(type="text", text="".join(parts))]
 
 
 async def list_jobs(arguments: Dict[str, Any]) -> List[TextContent]:
     """List jobs"""
     project_id = arguments.get("project_id")
     
-    # Use the get_jobs method that we know exists
-    if project_id:
-        endpoint = f"jobs/?project_id={project_id}"
-    else:
-        endpoint = "jobs/"
-    
-    response = await dbt_client._make_request("GET", endpoint)
-    jobs = response.get("data", [])
+    jobs = await dbt_client.get_jobs(project_id)
     
     if not jobs:
         filter_text = f" for project {project_id}" if project_id else ""
         return [TextContent(type="text", text=f"No jobs found{filter_text}")]
     
     filter_text = f" (filtered by project {project_id})" if project_id else ""
-    result_text = f"Available dbt Jobs{filter_text} ({len(jobs)}):\n\n"
+    parts = [f"Available dbt Jobs{filter_text} ({len(jobs)}):\n\n"]
     
     for job in jobs:
-        result_text += f"**{job['name']}**\n"
-        result_text += f"  ID: {job['id']}\n"
-        result_text += f"  Project ID: {job.get('project_id', 'N/A')}\n"
-        result_text += f"  Environment ID: {job.get('environment_id', 'N/A')}\n"
-        result_text += f"  State: {job.get('state', 'Unknown')}\n"
-        if job.get('description'):
-            result_text += f"  Description: {job['description']}\n"
-        result_text += "\n"
-    
-    return [TextContent(type="text", text=result_text)]
+        description = job.get("description")
+        parts.append(JOB_TEMPLATE.format_map({
+            "name": job["name"],
+            "id": job["id"],
+            "project_id": job.get("project_id", "N/A"),
+            "environment_id": job.get("environment_id", "N/A"),
+            "state": job.get("state", "Unknown"),
+            "description": f"  Description: {description}\n" if description else ""
+        }))
+    
+    return [TextContent(type="text", text="".join(parts))]
 
 
 async def main():
     """Main server function"""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    global dbt_client
+    dbt_client = DbtCloudClient()
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        await dbt_client.aclose()
 
 
 if __name__ == "__main__":